@@ -6,6 +6,9 @@ identical Canon states always produce byte-identical files (deterministic).
 """
 
 import json
+from pathlib import Path
+from typing import Any
+
 from .contract import Canon
 
 
@@ -22,8 +25,21 @@ def load_canon(path: str) -> Canon:
         FileNotFoundError: If the file does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # One read of raw bytes; json.loads decodes UTF-8 itself, skipping the
+    # incremental text-wrapper decode that json.load(f) goes through.
+    return json.loads(Path(path).read_bytes())
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """Serialize *obj* to canonical UTF-8 JSON bytes (sort_keys=True, indent=2).
+
+    The one serializer behind every Canon-store file (snapshots, history diffs,
+    violation reports), so identical values always produce identical bytes.
+    The POSIX trailing newline is included, so the result is a complete file
+    body ready for a single write.
+    """
+    text = json.dumps(obj, sort_keys=True, indent=2, ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
 
 
 def save_canon(path: str, canon: Canon) -> None:
@@ -36,6 +52,6 @@ def save_canon(path: str, canon: Canon) -> None:
         path: Destination file path (created or overwritten).
         canon: The Canon dict to persist.
     """
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(canon, f, sort_keys=True, indent=2, ensure_ascii=False)
-        f.write("\n")  # POSIX trailing newline
+    # Serialize in one call and write once: json.dump() streams hundreds of
+    # tiny fragments through the file object for a Canon of any size.
+    Path(path).write_bytes(dump_json_bytes(canon))
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict, Any
+from typing import Any, Dict, Iterable, Tuple
 
 Canon = Dict[str, Any]
 CanonDiff = Dict[str, Any]
@@ -31,3 +31,24 @@ def apply_canon_diff(canon: Canon, diff: CanonDiff) -> Tuple[Canon, list[str]]:
 
     new_canon = apply_diff(canon, diff)
     return (new_canon, [])
+
+
+def _apply_canon_diffs_bulk(canon: Canon, diffs: Iterable[CanonDiff]) -> Canon:
+    """Replay *diffs* onto *canon* in order, skipping any diff that is rejected.
+
+    Same result as folding apply_canon_diff over *diffs* and discarding the
+    errors, but the top-level dict and each touched section are copied once
+    for the whole replay rather than once per diff.  *canon* and the diffs
+    are never mutated.
+    """
+    from .diff import _merge_diff, validate_diff          # noqa: PLC0415
+    from .gate import check_hard_contradictions          # noqa: PLC0415
+
+    new_canon: Canon = dict(canon)
+    owned: set = set()
+    for diff in diffs:
+        # Each diff is still validated and gated against the state so far.
+        if validate_diff(diff) or check_hard_contradictions(new_canon, diff):
+            continue
+        _merge_diff(new_canon, owned, diff)
+    return new_canon
@@ -4,42 +4,42 @@ Produced by CanonGate: evaluates a ShotList and emits a decision artifact.
 Default decision is "allow". A shot whose text fields contain the literal
 token "FORBIDDEN" triggers a "deny" decision (Wave-1). The double-underscore
 form "__FORBIDDEN__" triggers "deny" with reasons == ["FORBIDDEN_TOKEN"] (Wave-4:
-now loaded from third_party/contracts/compat/forbidden_tokens.json rather than a compiled regex).
+now loaded from third_party/contracts/compat/forbidden_tokens.json).  Both forms
+are detected by a single fused pattern, _SCAN_RE, built from the policy file.
 """
 from __future__ import annotations
 
 import pathlib as _pathlib
 import re
-from typing import List, Literal
+from operator import attrgetter
+from typing import Any, Callable, Iterator, List, Literal, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class _Producer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     repo: str
     component: str
 
 
+# Immutable, so one instance is shared by every CanonDecision.
+_DEFAULT_PRODUCER = _Producer(repo="world-engine", component="CanonGate")
+
+
 class CanonDecision(BaseModel):
     schema_id: str = "CanonDecision"  # convention: PascalCase artifact class name
     schema_version: str = "0.0.1"
-    producer: _Producer = Field(
-        default_factory=lambda: _Producer(repo="world-engine", component="CanonGate")
-    )
+    producer: _Producer = _DEFAULT_PRODUCER
     timing_lock_hash: str
     decision: Literal["allow", "deny"] = "allow"
     reasons: List[str] = Field(default_factory=list)
 
 
-_FORBIDDEN_RE = re.compile(r'\bFORBIDDEN\b')
-
 _POLICY_FILE = _pathlib.Path(__file__).parent.parent / "third_party" / "contracts" / "compat" / "forbidden_tokens.json"
 
 
-#def _load_policy_tokens(path: _pathlib.Path) -> frozenset:
-#    import json as _j
-#    with path.open("r", encoding="utf-8") as f:
-#        return frozenset(_j.load(f).get("forbidden_tokens", []))
 def _load_policy_tokens(path: _pathlib.Path) -> frozenset[str]:
     import json as _j
     try:
@@ -58,60 +58,109 @@ def _load_policy_tokens(path: _pathlib.Path) -> frozenset[str]:
     # keep only strings, deterministic
     return frozenset(t for t in tokens if isinstance(t, str))
 
-_POLICY_TOKENS: frozenset = _load_policy_tokens(_POLICY_FILE)
+def _build_scan_re(policy_tokens: frozenset[str]) -> re.Pattern[str]:
+    """Fuse the policy tokens and the word-boundary FORBIDDEN check into one pattern.
+
+    Group ``pol`` matches any policy token (longest-first, then lexicographic, so
+    the pattern text is deterministic).  Group ``fb`` sits inside a zero-width
+    lookahead so it never consumes characters a policy token could start in.
+    """
+    fb = r"(?=(?P<fb>\bFORBIDDEN\b))"
+    if not policy_tokens:
+        return re.compile(fb)
+    ordered = sorted(policy_tokens, key=lambda t: (-len(t), t))
+    alts = "|".join(re.escape(t) for t in ordered)
+    return re.compile(f"(?P<pol>{alts})|{fb}")
+
+
+def _scan_prefilter(policy_tokens: frozenset[str]) -> Optional[str]:
+    """Literal contained in every scanner match, or None if no such literal is known.
+
+    Holds for "FORBIDDEN" when all policy tokens contain it (the shipped policy,
+    and trivially an empty one); a single memmem probe then rules out most texts
+    before the regex runs.
+    """
+    return "FORBIDDEN" if all("FORBIDDEN" in t for t in policy_tokens) else None
+
+
+# Policy state is loaded on first use (see _scanner) so `import canon` does no
+# file IO.  None is the not-yet-loaded sentinel.
+_POLICY_TOKENS: Optional[frozenset[str]] = None
+# One C-level pass per text covers both the Wave-4 policy tokens and the
+# Wave-1 FORBIDDEN word; dispatch on Match.lastgroup.
+_SCAN_RE: Optional[re.Pattern[str]] = None
+_SCAN_PREFILTER: Optional[str] = None
+
+
+def _scanner() -> Tuple[re.Pattern[str], Optional[str]]:
+    """Return (_SCAN_RE, _SCAN_PREFILTER), loading the policy file on first call."""
+    global _POLICY_TOKENS, _SCAN_RE, _SCAN_PREFILTER
+    if _SCAN_RE is None:
+        _POLICY_TOKENS = _load_policy_tokens(_POLICY_FILE)
+        _SCAN_PREFILTER = _scan_prefilter(_POLICY_TOKENS)
+        _SCAN_RE = _build_scan_re(_POLICY_TOKENS)
+    return _SCAN_RE, _SCAN_PREFILTER
+
 
 _REASON_TEXT_MAX = 200  # chars; keeps artifact size bounded
 
 _TEXT_FIELDS = (
     "action_beat", "environment_notes",
     "camera_framing", "camera_movement",
-    "action_summary",                     # forward-compat: not in current Shot model
 )
+_FORWARD_TEXT_FIELDS = ("action_summary",)      # forward-compat: not in current Shot model
 _CAMERA_FIELDS = ("framing_hint", "movement")   # nested shot.camera — forward-compat
 _AUDIO_TEXT_FIELDS = ("vo_text", "vo_speaker_id")
 
+# (container attribute, text fields, bundled getter) — "" reads the fields off the
+# shot itself.  A multi-field attrgetter fetches the whole tuple in one C call;
+# forward-compat fields are absent on real Shots, so they skip the bundle.
+_FIELD_SPECS = (
+    ("", _TEXT_FIELDS, attrgetter(*_TEXT_FIELDS)),
+    ("", _FORWARD_TEXT_FIELDS, None),
+    ("camera", _CAMERA_FIELDS, attrgetter(*_CAMERA_FIELDS)),
+    ("audio_intent", _AUDIO_TEXT_FIELDS, attrgetter(*_AUDIO_TEXT_FIELDS)),
+)
 
-def _shot_texts(shot) -> List[str]:
-    """Collect all human-readable string fields from a Shot (defensively)."""
-    texts: List[str] = []
-    # flat text fields (current model + forward-compat additions)
-    for field in _TEXT_FIELDS:
-        val = getattr(shot, field, None)
-        if isinstance(val, str):
-            texts.append(val)
-    # nested camera object — not in current Shot model; supported defensively
-    camera = getattr(shot, "camera", None)
-    if camera is not None:
-        for field in _CAMERA_FIELDS:
-            val = getattr(camera, field, None)
-            if isinstance(val, str):
-                texts.append(val)
-    # audio intent — required on current Shot, but getattr guards duck-typed callers
-    audio_intent = getattr(shot, "audio_intent", None)
-    if audio_intent is not None:
-        for field in _AUDIO_TEXT_FIELDS:
-            val = getattr(audio_intent, field, None)
+
+def _field_values(
+    obj: Any, fields: Tuple[str, ...], getter: Optional[Callable[[Any], Any]],
+) -> Sequence[Any]:
+    """Fetch *fields* from *obj* via *getter*, degrading to per-field getattr."""
+    if getter is not None:
+        try:
+            return getter(obj)
+        except AttributeError:   # duck-typed object without the full field set
+            pass
+    return [getattr(obj, field, None) for field in fields]
+
+
+def _iter_shot_texts(shot: Any) -> Iterator[str]:
+    """Yield all human-readable string fields from a Shot (defensively)."""
+    for container, fields, getter in _FIELD_SPECS:
+        obj = getattr(shot, container, None) if container else shot
+        if obj is None:
+            continue
+        for val in _field_values(obj, fields, getter):
             if isinstance(val, str):
-                texts.append(val)
-    return texts
+                yield val
 
 
-def _dead_char_ids(snapshot: dict) -> frozenset:
+def _dead_char_ids(snapshot: dict) -> frozenset[str]:
     """Return frozenset of character IDs whose alive fact is 'false' in *snapshot*."""
-    dead: set = set()
-    for entity in snapshot.get("entities", []):
-        if entity.get("type") != "character":
-            continue
-        char_id = entity.get("id")
-        if not char_id:
-            continue
-        for fact in entity.get("facts", []):
-            if fact.get("k") == "alive" and fact.get("v") == "false":
-                dead.add(char_id)
-    return frozenset(dead)
+    return frozenset(
+        entity["id"]
+        for entity in snapshot.get("entities", ())
+        if entity.get("type") == "character"
+        and entity.get("id")
+        and any(
+            fact.get("k") == "alive" and fact.get("v") == "false"
+            for fact in entity.get("facts", ())
+        )
+    )
 
 
-def evaluate_shotlist(shotlist, snapshot=None) -> CanonDecision:
+def evaluate_shotlist(shotlist: Any, snapshot: Optional[dict] = None) -> CanonDecision:
     """Evaluate *shotlist* and return a CanonDecision artifact.
 
     Rules (Wave-2 / Wave-5):
@@ -136,45 +185,67 @@ def evaluate_shotlist(shotlist, snapshot=None) -> CanonDecision:
     if not sid or not sver:
         raise ValueError("ERROR: ShotList missing schema metadata")
     # --- Wave-5: validate snapshot and build dead-char set ---
-    dead_chars: frozenset = frozenset()
+    dead_chars: frozenset[str] = frozenset()
     if snapshot is not None:
         if not isinstance(snapshot, dict) or "entities" not in snapshot:
             raise ValueError("ERROR: invalid CanonSnapshot input")
         dead_chars = _dead_char_ids(snapshot)
+    # Loop-invariant: one alternation over every "APPEARS:<dead char>" probe.
+    appears_search: Optional[Callable[[str], Any]] = None
+    if dead_chars:
+        probes = sorted(f"APPEARS:{char_id}" for char_id in dead_chars)
+        appears_search = re.compile("|".join(re.escape(p) for p in probes)).search
+    scan_re, prefilter = _scanner()
+    # Hot-loop names bound once as locals (LOAD_FAST instead of global/attr lookups).
+    scan = scan_re.finditer
+    iter_texts = _iter_shot_texts
+    reason_max = _REASON_TEXT_MAX
     # --- existing logic + Wave-5 contradiction check ---
     verbose_reasons: List[str] = []
+    add_reason = verbose_reasons.append
     double_forbidden_found: bool = False
     canon_contradiction: bool = False
     for shot in shotlist.shots:
-        texts = _shot_texts(shot)
-        # Wave-5: APPEARS token against dead characters (highest priority deny)
-        if dead_chars:
-            for text in texts:
-                for char_id in dead_chars:
-                    if f"APPEARS:{char_id}" in text:
-                        canon_contradiction = True
-        for text in texts:
-            if any(tok in text for tok in _POLICY_TOKENS):   # Wave-4: policy-file tokens
-                double_forbidden_found = True
-            elif _FORBIDDEN_RE.search(text):
-                snippet = text[:_REASON_TEXT_MAX]
-                verbose_reasons.append(
-                    f"shot {shot.shot_id!r} contains FORBIDDEN token: {snippet!r}"
-                )
+        for text in iter_texts(shot):
+            # Wave-5: APPEARS token against dead characters (highest priority deny)
+            if appears_search is not None and appears_search(text):
+                canon_contradiction = True
+                break   # nothing else can change the outcome
+            if double_forbidden_found:
+                continue   # reasons are fixed; only a contradiction can still win
+            if prefilter is not None and prefilter not in text:
+                continue
+            forbidden_word = False
+            for m in scan(text):
+                if m.lastgroup == "pol":   # Wave-4: policy-file tokens
+                    double_forbidden_found = True
+                    break
+                forbidden_word = True
+            else:
+                if forbidden_word:
+                    snippet = text[:reason_max]
+                    add_reason(
+                        f"shot {shot.shot_id!r} contains FORBIDDEN token: {snippet!r}"
+                    )
+        if canon_contradiction or (double_forbidden_found and appears_search is None):
+            break
     if canon_contradiction:
         reasons: List[str] = ["CANON_CONTRADICTION"]
     elif double_forbidden_found:
         reasons = ["FORBIDDEN_TOKEN"]
     else:
         reasons = verbose_reasons
-    return CanonDecision(
-        timing_lock_hash=shotlist.timing_lock_hash,
+    # Every field is a literal or the ShotList's own timing_lock_hash (checked
+    # above), so skip pydantic validation on this per-call path.
+    return CanonDecision.model_construct(
+        producer=_DEFAULT_PRODUCER,
+        timing_lock_hash=tlh,
         decision="deny" if reasons else "allow",
         reasons=reasons,
     )
 
 
-def assert_shotlist_canon(shotlist, snapshot=None) -> CanonDecision:
+def assert_shotlist_canon(shotlist: Any, snapshot: Optional[dict] = None) -> CanonDecision:
     """Like evaluate_shotlist but raises ValueError on deny.
 
     Raises:
@@ -191,6 +262,5 @@ def assert_shotlist_canon(shotlist, snapshot=None) -> CanonDecision:
 def dump_decision(decision: CanonDecision) -> str:
     """Serialize a CanonDecision to canonical JSON (sort_keys=True, indent=2)."""
     import json as _json
-    # raw = _json.loads(decision.model_dump_json())
     raw = decision.model_dump(mode="python")
     return _json.dumps(raw, sort_keys=True, indent=2, ensure_ascii=False)
@@ -5,7 +5,6 @@ validate_diff  — checks shape/types only; no canon-awareness.
 apply_diff     — merges a validated diff into a Canon; pure, no side-effects.
 """
 
-import copy
 from typing import List
 
 from .contract import Canon, CanonDiff
@@ -13,6 +12,9 @@ from .contract import Canon, CanonDiff
 _ALLOWED_TOP_KEYS = frozenset(
     {"modified_facts", "added_facts", "removed_facts", "justification", "provenance"}
 )
+# Sections that must be dicts.  A tuple, not a frozenset: iteration order fixes
+# the order of validate_diff's error messages.
+_DICT_SECTIONS = ("modified_facts", "added_facts")
 
 
 def validate_diff(diff: CanonDiff) -> List[str]:
@@ -34,7 +36,7 @@ def validate_diff(diff: CanonDiff) -> List[str]:
             f"INVALID_DIFF: unknown top-level keys: {sorted(unknown)}"
         )
 
-    for key in ("modified_facts", "added_facts"):
+    for key in _DICT_SECTIONS:
         if key in diff and not isinstance(diff[key], dict):
             errors.append(f"INVALID_DIFF: '{key}' must be a dict")
 
@@ -56,12 +58,33 @@ def validate_diff(diff: CanonDiff) -> List[str]:
     return errors
 
 
+def _own_section(new_canon: Canon, owned: set, section: str, kind: type):
+    """Return a private *kind* (dict or list) copy of ``new_canon[section]``.
+
+    The first request for a section shallow-copies it out of the shared input
+    (or starts it empty if it is missing or of another type); later requests
+    return the same private copy.
+    """
+    current = new_canon.get(section)
+    if section in owned and isinstance(current, kind):
+        return current
+    fresh = kind(current) if isinstance(current, kind) else kind()
+    new_canon[section] = fresh
+    owned.add(section)
+    return fresh
+
+
 def apply_diff(canon: Canon, diff: CanonDiff) -> Canon:
     """Apply a CanonDiff to a Canon and return the updated Canon.
 
-    Pure function — the input *canon* is never mutated.
+    Pure function — neither *canon* nor *diff* is ever mutated.
     Assumes the diff has already been validated (validate_diff returned []).
 
+    Copy-on-write: only the sections the diff touches are copied, and a
+    modified entry is rebuilt as a new dict.  Untouched sections and the
+    values inside entries are shared by reference with the inputs, so the
+    cost is O(diff) rather than O(canon); treat Canon dicts as immutable values.
+
     Merge order:
         1. added_facts   — insert new entries (do not overwrite existing)
         2. modified_facts — shallow-merge field updates into existing entries
@@ -74,39 +97,48 @@ def apply_diff(canon: Canon, diff: CanonDiff) -> Canon:
     Returns:
         A new Canon dict reflecting the applied changes.
     """
-    new_canon: Canon = copy.deepcopy(canon)
+    new_canon: Canon = dict(canon)
+    _merge_diff(new_canon, set(), diff)
+    return new_canon
+
+
+def _merge_diff(new_canon: Canon, owned: set, diff: CanonDiff) -> None:
+    """Merge *diff* into *new_canon* in place (the body of apply_diff).
+
+    *new_canon* must be a private top-level dict; *owned* names its sections
+    that are already private copies.  Sections are copied out on first write
+    and recorded in *owned*, so a caller folding several diffs into one
+    *new_canon* pays for each section copy once.
+    """
+    added = diff.get("added_facts") or {}
+    modified = diff.get("modified_facts") or {}
+    removed = diff.get("removed_facts") or {}
 
     # 1. added_facts — add new characters/entries; skip if key already exists
-    for section, entries in diff.get("added_facts", {}).items():
+    for section, entries in added.items():
         if isinstance(entries, dict):
-            if section not in new_canon or not isinstance(new_canon[section], dict):
-                new_canon[section] = {}
+            section_data = _own_section(new_canon, owned, section, dict)
             for entry_id, data in entries.items():
-                if entry_id not in new_canon[section]:
-                    new_canon[section][entry_id] = copy.deepcopy(data)
+                if entry_id not in section_data:
+                    section_data[entry_id] = dict(data) if isinstance(data, dict) else data
         elif isinstance(entries, list):
-            if section not in new_canon or not isinstance(new_canon[section], list):
-                new_canon[section] = []
-            new_canon[section].extend(copy.deepcopy(entries))
+            _own_section(new_canon, owned, section, list).extend(entries)
 
     # 2. modified_facts — shallow-merge updates into existing entries
-    for section, entries in diff.get("modified_facts", {}).items():
+    for section, entries in modified.items():
         if isinstance(entries, dict):
-            if section not in new_canon or not isinstance(new_canon[section], dict):
-                new_canon[section] = {}
+            section_data = _own_section(new_canon, owned, section, dict)
             for entry_id, data in entries.items():
                 if isinstance(data, dict):
-                    if entry_id not in new_canon[section]:
-                        new_canon[section][entry_id] = {}
-                    new_canon[section][entry_id].update(copy.deepcopy(data))
+                    section_data[entry_id] = {**section_data.get(entry_id, {}), **data}
 
     # 3. removed_facts — delete keys from dict sections
-    for section, keys in diff.get("removed_facts", {}).items():
+    for section, keys in removed.items():
         section_data = new_canon.get(section)
         if isinstance(section_data, dict):
+            section_data = _own_section(new_canon, owned, section, dict)
             for key in keys:
                 section_data.pop(key, None)
         elif isinstance(section_data, list):
             new_canon[section] = [e for e in section_data if e not in keys]
-
-    return new_canon
+            owned.add(section)
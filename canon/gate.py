@@ -15,10 +15,32 @@ Phase 0 rules:
     error (prevents silent creation through the modification path).
 """
 
-from typing import List
+from typing import Any, Callable, List, Optional, Tuple
 
 from .contract import Canon, CanonDiff
 
+# Distinguishes "field absent from changes" from an explicit None value.
+_MISSING = object()
+
+
+def _valid_nonempty_str(value: Any) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+# (field, validator) in check order.  A validator, when present, must accept the
+# diff's new value before it is compared — the name check ignores blank or
+# non-string names, which validate_diff does not reject.
+_FIELD_CHECKS: Tuple[Tuple[str, Optional[Callable[[Any], bool]]], ...] = (
+    ("name", _valid_nonempty_str),
+    ("age", None),
+    ("alive", None),
+    ("location", None),
+)
+# The immutable character fields, in check order (also used by the story-draft
+# validator).  String literals are already interned, so lookups keyed by these
+# names hit dict's identity fast path without any sys.intern().
+IMMUTABLE_FIELDS: Tuple[str, ...] = tuple(field for field, _ in _FIELD_CHECKS)
+
 
 def check_hard_contradictions(canon: Canon, diff: CanonDiff) -> List[str]:
     """Detect hard contradictions between *diff* and the current *canon*.
@@ -39,6 +61,7 @@ def check_hard_contradictions(canon: Canon, diff: CanonDiff) -> List[str]:
         List of error strings; empty list means no hard contradictions found.
     """
     errors: List[str] = []
+    errors_append = errors.append
 
     canon_chars: dict = canon.get("characters", {})
     added_chars: dict = diff.get("added_facts", {}).get("characters", {})
@@ -46,59 +69,34 @@ def check_hard_contradictions(canon: Canon, diff: CanonDiff) -> List[str]:
 
     for char_id, changes in modified_chars.items():
         # ── Existence check ────────────────────────────────────────────────
-        if char_id not in canon_chars and char_id not in added_chars:
-            errors.append(
-                f"INVALID_DIFF: characters.{char_id} modified but does not exist"
-                " (use added_facts)"
-            )
-            continue  # field checks are meaningless for a non-existent character
-
-        # For chars being added in the same diff, canon_char will be empty —
-        # no field-level contradiction is possible against empty canon data.
-        canon_char: dict = canon_chars.get(char_id, {})
+        # One probe fetches the canon entry and proves existence; added_chars
+        # is only consulted for characters canon does not know.
+        canon_char = canon_chars.get(char_id, _MISSING)
+        if canon_char is _MISSING:
+            if char_id not in added_chars:
+                errors_append(
+                    f"INVALID_DIFF: characters.{char_id} modified but does not exist"
+                    " (use added_facts)"
+                )
+                continue  # field checks are meaningless for a non-existent character
+            # Being added in the same diff — no field-level contradiction is
+            # possible against empty canon data.
+            canon_char = {}
 
         if not isinstance(changes, dict):
             continue  # structural issues are caught by validate_diff
 
-        # ── Name ───────────────────────────────────────────────────────────
-        if "name" in changes:
-            new_name = changes["name"]
-            if isinstance(new_name, str) and new_name:
-                old_name = canon_char.get("name")
-                if old_name is not None and old_name != new_name:
-                    errors.append(
-                        f"CONTRADICTION: characters.{char_id}.name"
-                        f" — canon='{old_name}' vs diff='{new_name}'"
-                    )
-
-        # ── Age ────────────────────────────────────────────────────────────
-        if "age" in changes:
-            new_age = changes["age"]
-            old_age = canon_char.get("age")
-            if old_age is not None and old_age != new_age:
-                errors.append(
-                    f"CONTRADICTION: characters.{char_id}.age"
-                    f" — canon='{old_age}' vs diff='{new_age}'"
-                )
-
-        # ── Alive / death status ───────────────────────────────────────────
-        if "alive" in changes:
-            new_alive = changes["alive"]
-            old_alive = canon_char.get("alive")
-            if old_alive is not None and old_alive != new_alive:
-                errors.append(
-                    f"CONTRADICTION: characters.{char_id}.alive"
-                    f" — canon='{old_alive}' vs diff='{new_alive}'"
-                )
-
-        # ── Location ───────────────────────────────────────────────────────
-        if "location" in changes:
-            new_loc = changes["location"]
-            old_loc = canon_char.get("location")
-            if old_loc is not None and old_loc != new_loc:
-                errors.append(
-                    f"CONTRADICTION: characters.{char_id}.location"
-                    f" — canon='{old_loc}' vs diff='{new_loc}'"
+        for field, validator in _FIELD_CHECKS:
+            new_val = changes.get(field, _MISSING)
+            if new_val is _MISSING:
+                continue
+            if validator is not None and not validator(new_val):
+                continue
+            old_val = canon_char.get(field)
+            if old_val is not None and old_val != new_val:
+                errors_append(
+                    f"CONTRADICTION: characters.{char_id}.{field}"
+                    f" — canon='{old_val}' vs diff='{new_val}'"
                 )
 
     return errors
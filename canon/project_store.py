@@ -4,25 +4,45 @@ project_store.py — Project-aware Canon Store (Option C: snapshot + diff log).
 Layout under <base_dir>/<project_id>/:
 
     CanonSnapshot.json              ← current state (always latest)
+    CanonSnapshot.head              ← optional: history entry the snapshot replays to
     history/
         0001_<episode_id>.diff.json ← immutable once written; one per accepted diff
         0002_<episode_id>.diff.json
         ...
+        0050_<episode_id>.snapshot.json ← optional checkpoint: replay state through 0050
     violations/
         <episode_id>_CanonViolationReport.json   ← written by validate-story-draft on failure
 
 Sequence numbers are supplied by the caller (orchestrator) via episode_seq — never
 computed from file count, so parallel episode runs cannot race.
+
+CanonSnapshot.head records that the snapshot equals replaying history from {}
+through the named entry, that entry's position in history, and the snapshot's
+SHA-256.  It is established when the first entry's diff alone yields the saved
+canon, then carried forward one entry per in-order save when the diff applied
+to the vouched-for snapshot yields exactly the saved canon.  A save that sorts
+before the head's entry, or whose canon is not that replay, drops it.
+load_canon_at_episode starts from the snapshot instead of {} only while the
+named entry still sits at the recorded position and the digest still matches.
+
+Every ``checkpoint_every``-th entry (by episode_seq) also gets a checkpoint: the
+replayed state through that entry and the entry's position in history, written
+beside it when that state is known at save time.  Replay starts from the
+nearest checkpoint at or before the target, so it reads at most
+``checkpoint_every`` diffs however long the history.  A checkpoint whose entry
+has since moved (an earlier entry was saved after it) is skipped as stale.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
-from .canon_io import load_canon, save_canon
-from .contract import Canon, CanonDiff
+from .canon_io import dump_json_bytes, load_canon
+from .contract import Canon, CanonDiff, _apply_canon_diffs_bulk
 
 if TYPE_CHECKING:
     pass
@@ -48,8 +68,146 @@ def _violations_dir(project_id: str, base_dir: str | Path) -> Path:
     return _project_dir(project_id, base_dir) / "violations"
 
 
+_SNAPSHOT_HEAD = "CanonSnapshot.head"
+
+_DIFF_SUFFIX = ".diff.json"
+_CHECKPOINT_SUFFIX = ".snapshot.json"
+_CHECKPOINT_EVERY = 50
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read history file *path* whole; history entries are never cached in memory."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_bytes_excl(path: Path, data: bytes) -> None:
+    """Create *path* and write *data*; FileExistsError if it already exists."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling temp file and rename it over *path*."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _read_head(proj_dir: Path) -> Optional[dict]:
+    """Return the parsed CanonSnapshot.head, or None if it is missing or malformed."""
+    try:
+        head = json.loads((proj_dir / _SNAPSHOT_HEAD).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return None
+    if (
+        not isinstance(head, dict)
+        or not isinstance(head.get("entry"), str)
+        or not isinstance(head.get("entries"), int)
+    ):
+        return None
+    return head
+
+
+def _head_snapshot(head: dict, data: Optional[bytes]) -> Optional[Canon]:
+    """Parse snapshot bytes *data* if their digest still matches *head*, else None.
+
+    A mismatch means the snapshot was replaced behind the store's back (e.g.
+    edited by hand), so the head no longer describes it.
+    """
+    if data is None or head.get("sha256") != hashlib.sha256(data).hexdigest():
+        return None
+    return json.loads(data)
+
+
+def _read_snapshot_bytes(proj_dir: Path) -> Optional[bytes]:
+    try:
+        return (proj_dir / "CanonSnapshot.json").read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _same_canonical_bytes(a: Canon, b: Canon) -> bool:
+    """True if dump_json_bytes(a) == dump_json_bytes(b).
+
+    dump_json_bytes indents, which sends json.dumps through its pure-Python
+    encoder; the compact form holds the same tokens in the same order, so it
+    compares identically and is produced by the C encoder.
+    """
+    return (
+        json.dumps(a, sort_keys=True, ensure_ascii=False)
+        == json.dumps(b, sort_keys=True, ensure_ascii=False)
+    )
+
+
+def _head_entries(
+    old_head: Optional[dict], old_snapshot: Optional[bytes],
+    diff_name: str, diff: CanonDiff, canon: Canon,
+) -> Optional[int]:
+    """History position to record for a head naming *diff_name*, or None for no head.
+
+    The head is only written when *canon* is proven to be the replay state:
+    *diff* applied to {} (no previous head) or to *old_snapshot* when the
+    previous head vouches for it must serialize to exactly what *canon* does.
+    The cost is one canon's size, independent of history length.  A wrong position is harmless, since
+    _replay_seed ignores a head whose entry is not at its recorded position.
+    """
+    if old_head is None:
+        # Only a first entry can start a head; load rejects it if it is not first.
+        base: Optional[Canon] = {}
+        entries = 1
+    elif diff_name < old_head["entry"]:
+        return None   # inserted before the head's entry: every later state is stale
+    else:
+        base = _head_snapshot(old_head, old_snapshot)
+        entries = old_head["entries"] + 1
+    if base is None:
+        return None
+    replayed = _apply_canon_diffs_bulk(base, (diff,))
+    return entries if _same_canonical_bytes(replayed, canon) else None
+
+
+def _replay_seed(
+    proj_dir: Path, diff_names: List[str], target_idx: int, checkpoints: Set[str],
+) -> Tuple[Canon, int]:
+    """Return (starting canon, index of the first diff still to replay).
+
+    Seeds from whichever is later of the snapshot (when its head names an entry
+    at or before the target, at the position the head recorded) and the
+    nearest checkpoint at or before the target whose recorded position still
+    holds; otherwise replay starts from {} at the first entry.
+    """
+    seed: Canon = {}
+    start_idx = 0
+    head = _read_head(proj_dir)
+    if head is not None:
+        head_idx = head["entries"] - 1
+        if 0 <= head_idx <= target_idx and diff_names[head_idx] == head["entry"]:
+            snapshot = _head_snapshot(head, _read_snapshot_bytes(proj_dir))
+            if snapshot is not None:
+                seed, start_idx = snapshot, head_idx + 1
+
+    for idx in range(target_idx, start_idx - 1, -1):
+        name = _checkpoint_filename(diff_names[idx])
+        if name not in checkpoints:
+            continue
+        checkpoint = json.loads((proj_dir / "history" / name).read_bytes())
+        if isinstance(checkpoint, dict) and checkpoint.get("entries") == idx + 1:
+            return checkpoint["canon"], idx + 1
+    return seed, start_idx
+
+
 def _diff_filename(episode_seq: int, episode_id: str) -> str:
-    return f"{episode_seq:04d}_{episode_id}.diff.json"
+    return f"{episode_seq:04d}_{episode_id}{_DIFF_SUFFIX}"
+
+
+def _checkpoint_filename(diff_name: str) -> str:
+    return diff_name[:-len(_DIFF_SUFFIX)] + _CHECKPOINT_SUFFIX
 
 
 # ---------------------------------------------------------------------------
@@ -85,16 +243,20 @@ def save_project_canon(
     diff: CanonDiff,
     episode_id: str,
     episode_seq: int,
+    checkpoint_every: int = _CHECKPOINT_EVERY,
 ) -> None:
     """Persist an accepted CanonDiff and update the project snapshot.
 
     History write order (Option C):
       1. Ensure ``history/`` directory exists.
       2. Write ``history/<episode_seq:04d>_<episode_id>.diff.json`` (immutable).
-      3. Overwrite ``CanonSnapshot.json`` with the new canon state.
+      3. Replace ``CanonSnapshot.json`` with the new canon state (written to
+         ``CanonSnapshot.json.tmp`` first, then renamed over it atomically).
 
     Step 2 is intentionally before Step 3 so that a crash between them leaves
     the diff on disk — the snapshot can be reconstructed by replaying history.
+    When *episode_seq* is a multiple of *checkpoint_every* and the replay state
+    through this entry is known, it is also written as a history checkpoint.
 
     Args:
         project_id:  Stable project identifier.
@@ -104,29 +266,63 @@ def save_project_canon(
         episode_id:  Human-readable episode identifier (e.g. "ep002").
         episode_seq: Monotonic sequence number supplied by orchestrator.
                      Determines the history filename; must be unique per project.
+        checkpoint_every: Checkpoint interval in sequence numbers; 0 disables.
 
     Raises:
         FileExistsError: If a diff file with the same sequence number already
                          exists (guards against accidental duplicate writes).
     """
     proj_dir = _project_dir(project_id, base_dir)
-    history_dir = _history_dir(project_id, base_dir)
+    history_dir = proj_dir / "history"
     history_dir.mkdir(parents=True, exist_ok=True)
 
-    diff_path = history_dir / _diff_filename(episode_seq, episode_id)
-    if diff_path.exists():
+    diff_name = _diff_filename(episode_seq, episode_id)
+    diff_path = history_dir / diff_name
+    old_head = _read_head(proj_dir)
+
+    # 2. Write immutable diff entry — O_EXCL makes "must not exist yet" part of
+    #    the create itself, so there is no window between check and write.
+    diff_buf = dump_json_bytes(diff)
+    try:
+        _write_bytes_excl(diff_path, diff_buf)
+    except FileExistsError:
         raise FileExistsError(
             f"History entry already exists for seq={episode_seq} "
             f"in project '{project_id}': {diff_path}"
+        ) from None
+
+    # 3. Overwrite current snapshot: write a sibling temp file, then rename it
+    #    over the old one so readers never see a torn snapshot.
+    snapshot_path = proj_dir / "CanonSnapshot.json"
+    head_path = proj_dir / _SNAPSHOT_HEAD
+    buf = dump_json_bytes(canon)
+    # One read of the old snapshot serves both the head proof and the
+    # unchanged-canon check, and happens before the snapshot is replaced.
+    old_snapshot = _read_snapshot_bytes(proj_dir)
+    entries = _head_entries(old_head, old_snapshot, diff_name, diff, canon)
+    unchanged = old_snapshot == buf
+    if not unchanged or entries is None:
+        # Drop the head first: a crash must never leave it describing a
+        # snapshot other than the one on disk.
+        head_path.unlink(missing_ok=True)
+    if not unchanged:
+        _write_bytes_atomic(snapshot_path, buf)
+    if entries is None:
+        return  # replay state through this entry is unknown
+
+    # From here on *canon* is proven to be the replay state through this entry
+    # (see _head_entries), so a checkpoint never records state history lacks.
+    if checkpoint_every > 0 and episode_seq % checkpoint_every == 0:
+        checkpoint = {"canon": canon, "entries": entries}
+        _write_bytes_atomic(
+            history_dir / _checkpoint_filename(diff_name), dump_json_bytes(checkpoint),
         )
-
-    # 2. Write immutable diff entry
-    with open(diff_path, "w", encoding="utf-8") as f:
-        json.dump(diff, f, sort_keys=True, indent=2, ensure_ascii=False)
-        f.write("\n")
-
-    # 3. Overwrite current snapshot
-    save_canon(str(proj_dir / "CanonSnapshot.json"), canon)
+    head = {
+        "entries": entries,
+        "entry": diff_name,
+        "sha256": hashlib.sha256(buf).hexdigest(),
+    }
+    _write_bytes_atomic(head_path, dump_json_bytes(head))
 
 
 def save_violation_report(
@@ -150,9 +346,7 @@ def save_violation_report(
     violations_dir.mkdir(parents=True, exist_ok=True)
 
     out_path = violations_dir / f"{episode_id}_CanonViolationReport.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, sort_keys=True, indent=2, ensure_ascii=False)
-        f.write("\n")
+    out_path.write_bytes(dump_json_bytes(report))
     return out_path
 
 
@@ -166,6 +360,9 @@ def load_canon_at_episode(
 
     Diffs are replayed in filename order (by sequence number prefix).
     Stops after applying the first diff whose filename contains *episode_id*.
+    When CanonSnapshot.head shows the snapshot equals the replay through an
+    entry at or before the target, replay starts from the snapshot instead;
+    a later checkpoint at or before the target takes precedence over it.
 
     Args:
         project_id: Stable project identifier.
@@ -180,35 +377,46 @@ def load_canon_at_episode(
         ValueError: If episode_id is not found in history.
     """
     history_dir = _history_dir(project_id, base_dir)
-    if not history_dir.exists():
+    # One directory scan and a sort of plain names — no per-entry Path objects.
+    # The zero-padded "NNNN_" prefix makes lexicographic order sequence order.
+    diff_names: List[str] = []
+    checkpoints: Set[str] = set()
+    try:
+        with os.scandir(history_dir) as it:
+            for e in it:
+                if e.name.endswith(_DIFF_SUFFIX):
+                    diff_names.append(e.name)
+                elif e.name.endswith(_CHECKPOINT_SUFFIX):
+                    checkpoints.add(e.name)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"No history directory for project '{project_id}' at {history_dir}"
-        )
-
-    diff_files = sorted(history_dir.glob("*.diff.json"))
-    if not diff_files:
+        ) from None
+    diff_names.sort()
+    if not diff_names:
         raise FileNotFoundError(
             f"No history entries found for project '{project_id}'"
         )
 
-    from .contract import apply_canon_diff  # noqa: PLC0415
-
-    canon: Canon = {}
-    found = False
-    for diff_file in diff_files:
-        with open(diff_file, "r", encoding="utf-8") as f:
-            diff: CanonDiff = json.load(f)
-        canon, errors = apply_canon_diff(canon, diff)
-        if errors:
-            # History should only contain accepted diffs; log and continue
-            pass
-        if episode_id in diff_file.name:
-            found = True
-            break
-
-    if not found:
+    # Locate the target by name first, so a miss costs no parsing and replay
+    # never reads a file past the target.
+    target_idx = next(
+        (i for i, name in enumerate(diff_names) if episode_id in name), None
+    )
+    if target_idx is None:
         raise ValueError(
             f"Episode '{episode_id}' not found in history for project '{project_id}'"
         )
 
-    return canon
+    # Start from the latest checkpoint or head-vouched snapshot at or before
+    # the target; only the diffs after that entry then need reading.
+    canon, start_idx = _replay_seed(history_dir.parent, diff_names, target_idx, checkpoints)
+
+    # Bytes straight into the C decoder: no text wrapper or incremental decode.
+    # History should only contain accepted diffs; any that are rejected on
+    # replay are skipped, as apply_canon_diff would leave the canon unchanged.
+    diffs = (
+        json.loads(_read_bytes(os.path.join(history_dir, name)))
+        for name in diff_names[start_idx:target_idx + 1]
+    )
+    return _apply_canon_diffs_bulk(canon, diffs)
@@ -9,62 +9,53 @@ Covers:
 """
 from __future__ import annotations
 
+import copy
+
 import pytest
 
 from world_engine.adaptation.models import AudioIntent, Shot, ShotList
-from canon.decision import dump_decision, evaluate_shotlist
+from canon.decision import assert_shotlist_canon, dump_decision, evaluate_shotlist
+
+
+# Default (all-empty) AudioIntent shared by every Shot built here; no test mutates it.
+_EMPTY_AUDIO_INTENT = AudioIntent()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Snapshot fixtures
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _snapshot_dead_lena() -> dict:
-    """CanonSnapshot: char_lena is dead (alive=false)."""
-    return {
-        "entities": [
-            {
-                "id": "char_lena",
-                "type": "character",
-                "facts": [
-                    {"k": "alive", "v": "false"}
-                ],
-            }
-        ]
-    }
-
-
-def _snapshot_alive_lena() -> dict:
-    """CanonSnapshot: char_lena is alive (alive=true)."""
-    return {
-        "entities": [
-            {
-                "id": "char_lena",
-                "type": "character",
-                "facts": [
-                    {"k": "alive", "v": "true"}
-                ],
-            }
-        ]
-    }
+# Never mutated: evaluate_shotlist only reads its snapshot, and a test that
+# needs an edited snapshot deep-copies one of these first.
+_SNAP_DEAD_LENA = {
+    "entities": [
+        {"id": "char_lena", "type": "character", "facts": [{"k": "alive", "v": "false"}]},
+    ]
+}
+
+_SNAP_ALIVE_LENA = {
+    "entities": [
+        {"id": "char_lena", "type": "character", "facts": [{"k": "alive", "v": "true"}]},
+    ]
+}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# ShotList fixtures
+# ShotList fixtures — known-good data, so built with model_construct (no validation)
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _appears_shotlist(char_id: str = "char_lena") -> ShotList:
     """ShotList with a shot whose action_beat contains APPEARS:<char_id>."""
-    shot = Shot(
+    shot = Shot.model_construct(
         shot_id="s001_shot_001",
         scene_id="s001",
         duration_sec=2.0,
         action_beat=f"APPEARS:{char_id} walks into the room",
         camera_framing="WIDE",
         camera_movement="STATIC",
-        audio_intent=AudioIntent(),
+        audio_intent=_EMPTY_AUDIO_INTENT,
     )
-    return ShotList(
+    return ShotList.model_construct(
         shotlist_id="sl_snap_appears",
         script_id="snap_appears",
         shots=[shot],
@@ -76,16 +67,16 @@ def _appears_shotlist(char_id: str = "char_lena") -> ShotList:
 
 def _clean_shotlist() -> ShotList:
     """ShotList with no APPEARS token in any field."""
-    shot = Shot(
+    shot = Shot.model_construct(
         shot_id="s001_shot_002",
         scene_id="s001",
         duration_sec=3.0,
         action_beat="The sun rises over the hill",
         camera_framing="WIDE",
         camera_movement="STATIC",
-        audio_intent=AudioIntent(),
+        audio_intent=_EMPTY_AUDIO_INTENT,
     )
-    return ShotList(
+    return ShotList.model_construct(
         shotlist_id="sl_snap_clean",
         script_id="snap_clean",
         shots=[shot],
@@ -95,62 +86,86 @@ def _clean_shotlist() -> ShotList:
     )
 
 
+# Built once per run and shared: evaluate_shotlist never mutates its inputs.
+
+@pytest.fixture(scope="session")
+def dead_lena_snapshot() -> dict:
+    return _SNAP_DEAD_LENA
+
+
+@pytest.fixture(scope="session")
+def alive_lena_snapshot() -> dict:
+    return _SNAP_ALIVE_LENA
+
+
+@pytest.fixture(scope="session")
+def lena_shotlist() -> ShotList:
+    return _appears_shotlist("char_lena")
+
+
+@pytest.fixture(scope="session")
+def clean_shotlist() -> ShotList:
+    return _clean_shotlist()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests
 # ─────────────────────────────────────────────────────────────────────────────
 
 class TestNoSnapshot:
 
-    def test_no_snapshot_allow(self):
+    def test_no_snapshot_allow(self, clean_shotlist):
         """evaluate_shotlist without snapshot arg must still return 'allow' for clean list."""
-        sl = _clean_shotlist()
-        result = evaluate_shotlist(sl)
+        result = evaluate_shotlist(clean_shotlist)
         assert result.decision == "allow"
         assert result.reasons == []
 
 
 class TestConsistentSnapshot:
 
-    def test_consistent_allow(self):
+    def test_consistent_allow(self, lena_shotlist, alive_lena_snapshot):
         """Alive character appearing in a shot must NOT trigger a contradiction → allow."""
-        sl = _appears_shotlist("char_lena")
-        snap = _snapshot_alive_lena()
-        result = evaluate_shotlist(sl, snapshot=snap)
+        result = evaluate_shotlist(lena_shotlist, snapshot=alive_lena_snapshot)
         assert result.decision == "allow"
 
 
 class TestContradictionSnapshot:
 
-    def test_contradiction_deny(self):
+    def test_contradiction_deny(self, lena_shotlist, dead_lena_snapshot):
         """Dead character appearing in a shot must trigger deny + CANON_CONTRADICTION."""
-        sl = _appears_shotlist("char_lena")
-        snap = _snapshot_dead_lena()
+        result = evaluate_shotlist(lena_shotlist, snapshot=dead_lena_snapshot)
+        assert result.decision == "deny"
+        assert result.reasons == ["CANON_CONTRADICTION"]
+
+    def test_contradiction_with_several_dead_characters(self):
+        """Any dead character in the snapshot must be caught, not just the first."""
+        sl = _appears_shotlist("char_king")
+        snap = copy.deepcopy(_SNAP_DEAD_LENA)
+        snap["entities"].append(
+            {"id": "char_king", "type": "character", "facts": [{"k": "alive", "v": "false"}]}
+        )
         result = evaluate_shotlist(sl, snapshot=snap)
         assert result.decision == "deny"
         assert result.reasons == ["CANON_CONTRADICTION"]
 
-    def test_byte_determinism(self):
+    def test_byte_determinism(self, lena_shotlist, dead_lena_snapshot):
         """Two calls with identical inputs must produce byte-identical dump_decision output."""
-        sl = _appears_shotlist("char_lena")
-        snap = _snapshot_dead_lena()
-        out1 = dump_decision(evaluate_shotlist(sl, snapshot=snap))
-        out2 = dump_decision(evaluate_shotlist(sl, snapshot=snap))
+        out1 = dump_decision(evaluate_shotlist(lena_shotlist, snapshot=dead_lena_snapshot))
+        out2 = dump_decision(evaluate_shotlist(lena_shotlist, snapshot=dead_lena_snapshot))
         assert out1 == out2
 
 
 class TestInvalidSnapshot:
 
-    def test_invalid_snapshot_raises(self):
+    def test_invalid_snapshot_raises(self, clean_shotlist):
         """Passing a non-dict snapshot must raise ValueError with canonical message."""
-        sl = _clean_shotlist()
         with pytest.raises(ValueError, match="ERROR: invalid CanonSnapshot input"):
-            evaluate_shotlist(sl, snapshot="not-a-dict")
+            evaluate_shotlist(clean_shotlist, snapshot="not-a-dict")
 
-    def test_missing_entities_raises(self):
+    def test_missing_entities_raises(self, clean_shotlist):
         """Passing a dict without 'entities' key must raise ValueError."""
-        sl = _clean_shotlist()
         with pytest.raises(ValueError, match="ERROR: invalid CanonSnapshot input"):
-            evaluate_shotlist(sl, snapshot={"characters": []})
+            evaluate_shotlist(clean_shotlist, snapshot={"characters": []})
 
 
 class TestAssertShotlistCanon:
@@ -175,7 +190,7 @@ class TestAssertShotlistCanon:
             action_beat="APPEARS:alex __FORBIDDEN__",
             camera_framing="WIDE",
             camera_movement="STATIC",
-            audio_intent=AudioIntent(),
+            audio_intent=_EMPTY_AUDIO_INTENT,
         )
         sl = ShotList(
             shotlist_id="sl_test_precedence",
@@ -194,10 +209,33 @@ class TestAssertShotlistCanon:
         # Precedence requirement: CANON_CONTRADICTION must override forbidden reasons
         assert decision.reasons == ["CANON_CONTRADICTION"]
     
-    def test_contradiction_raises(self):
+    def test_contradiction_in_later_shot_overrides_earlier_forbidden(self, dead_lena_snapshot):
+        """A policy token in shot 1 must not stop the scan before a later contradiction."""
+        shots = [
+            Shot(
+                shot_id=f"s001_shot_{i:03d}",
+                scene_id="s001",
+                duration_sec=2.0,
+                action_beat=beat,
+                camera_framing="WIDE",
+                camera_movement="STATIC",
+                audio_intent=_EMPTY_AUDIO_INTENT,
+            )
+            for i, beat in enumerate(["Mage performs __FORBIDDEN__ ritual",
+                                      "APPEARS:char_lena at the gate"])
+        ]
+        sl = ShotList(
+            shotlist_id="sl_test_order",
+            script_id="test_002",
+            shots=shots,
+            total_duration_sec=4.0,
+            timing_lock_hash="e" * 64,
+            created_at="2026-02-20T00:00:00Z",
+        )
+        decision = evaluate_shotlist(sl, snapshot=dead_lena_snapshot)
+        assert decision.reasons == ["CANON_CONTRADICTION"]
+
+    def test_contradiction_raises(self, lena_shotlist, dead_lena_snapshot):
         """assert_shotlist_canon must raise ValueError with the canonical message."""
-        from canon.decision import assert_shotlist_canon
-        sl = _appears_shotlist("char_lena")
-        snap = _snapshot_dead_lena()
         with pytest.raises(ValueError, match="ERROR: CanonGate denied: CANON_CONTRADICTION"):
-            assert_shotlist_canon(sl, snapshot=snap)
+            assert_shotlist_canon(lena_shotlist, snapshot=dead_lena_snapshot)
@@ -1,6 +1,8 @@
 """Tests for canon/project_store.py — Option C project-aware Canon Store."""
 from __future__ import annotations
 
+import copy
+import functools
 import json
 from pathlib import Path
 
@@ -18,7 +20,9 @@ from canon.project_store import (
 # Fixtures
 # ---------------------------------------------------------------------------
 
-def _base_canon() -> dict:
+@functools.lru_cache(maxsize=1)
+def _canon_template() -> dict:
+    """Base Canon built once; never hand it out directly — see _base_canon()."""
     return {
         "characters": {
             "char_lena": {"name": "Lena", "age": 30, "alive": True, "location": "Castle"},
@@ -26,6 +30,11 @@ def _base_canon() -> dict:
     }
 
 
+def _base_canon() -> dict:
+    """Fresh copy of the base Canon, so a test that mutates it cannot leak state."""
+    return copy.deepcopy(_canon_template())
+
+
 def _diff_add_marco() -> dict:
     return {
         "added_facts": {
@@ -88,7 +97,7 @@ class TestSaveProjectCanon:
         save_project_canon("proj1", tmp_path, canon, diff, "ep001", episode_seq=1)
 
         saved = json.loads(
-            (tmp_path / "proj1" / "CanonSnapshot.json").read_text(encoding="utf-8")
+            (tmp_path / "proj1" / "CanonSnapshot.json").read_bytes()
         )
         assert saved == canon
 
@@ -98,7 +107,7 @@ class TestSaveProjectCanon:
         save_project_canon("proj1", tmp_path, canon, diff, "ep001", episode_seq=1)
 
         saved_diff = json.loads(
-            (tmp_path / "proj1" / "history" / "0001_ep001.diff.json").read_text()
+            (tmp_path / "proj1" / "history" / "0001_ep001.diff.json").read_bytes()
         )
         assert saved_diff == diff
 
@@ -122,9 +131,22 @@ class TestSaveProjectCanon:
         save_project_canon("p", tmp_path, canon_v1, {}, "ep001", episode_seq=1)
         save_project_canon("p", tmp_path, canon_v2, {}, "ep002", episode_seq=2)
 
-        loaded = json.loads((tmp_path / "p" / "CanonSnapshot.json").read_text())
+        loaded = json.loads((tmp_path / "p" / "CanonSnapshot.json").read_bytes())
         assert loaded["extra"] == "data"
 
+    def test_snapshot_write_leaves_no_temp_file(self, tmp_path: Path):
+        save_project_canon("p", tmp_path, _base_canon(), {}, "ep001", episode_seq=1)
+        save_project_canon("p", tmp_path, {}, {}, "ep002", episode_seq=2)
+        assert not list((tmp_path / "p").glob("*.tmp"))
+
+    def test_unchanged_snapshot_is_not_rewritten(self, tmp_path: Path):
+        save_project_canon("p", tmp_path, _base_canon(), {}, "ep001", episode_seq=1)
+        before = (tmp_path / "p" / "CanonSnapshot.json").stat().st_ino
+        save_project_canon("p", tmp_path, _base_canon(), {}, "ep002", episode_seq=2)
+
+        assert (tmp_path / "p" / "CanonSnapshot.json").stat().st_ino == before
+        assert (tmp_path / "p" / "history" / "0002_ep002.diff.json").exists()
+
     def test_creates_base_dir_when_it_does_not_exist(self, tmp_path: Path):
         """save_project_canon must work even when base_dir/<project_id> doesn't exist yet."""
         nonexistent = tmp_path / "new_base" / "nested"
@@ -143,6 +165,14 @@ class TestSaveProjectCanon:
         with pytest.raises(FileExistsError):
             save_project_canon("p", tmp_path, {}, {}, "ep001", episode_seq=1)
 
+    def test_duplicate_sequence_keeps_original_entry(self, tmp_path: Path):
+        save_project_canon("p", tmp_path, {}, _diff_add_marco(), "ep001", episode_seq=1)
+        with pytest.raises(FileExistsError, match="already exists"):
+            save_project_canon("p", tmp_path, {}, _diff_update_location(), "ep001", episode_seq=1)
+
+        saved = json.loads((tmp_path / "p" / "history" / "0001_ep001.diff.json").read_bytes())
+        assert saved == _diff_add_marco()
+
     def test_history_file_has_sorted_keys(self, tmp_path: Path):
         """sort_keys=True is applied per nesting level — verify via round-trip parse."""
         diff = {"modified_facts": {"z": 1}, "added_facts": {"a": 2}}
@@ -171,7 +201,7 @@ class TestSaveViolationReport:
         path = save_violation_report("proj1", tmp_path, report, "ep003")
         assert path.exists()
         assert path.name == "ep003_CanonViolationReport.json"
-        assert json.loads(path.read_text()) == report
+        assert json.loads(path.read_bytes()) == report
 
 
 # ---------------------------------------------------------------------------
@@ -206,6 +236,14 @@ class TestLoadCanonAtEpisode:
         # ep001 only adds char_marco; ep002 modifies char_lena — so char_lena absent
         assert "char_marco" in replayed.get("characters", {})
 
+    def test_does_not_read_past_target_episode(self, tmp_path: Path):
+        save_project_canon("p", tmp_path, {}, _diff_add_marco(), "ep001", episode_seq=1)
+        # A later entry that is not valid JSON must never be parsed.
+        (tmp_path / "p" / "history" / "0002_ep002.diff.json").write_text("{not json")
+
+        replayed = load_canon_at_episode("p", tmp_path, "ep001")
+        assert "char_marco" in replayed.get("characters", {})
+
     def test_raises_on_missing_history(self, tmp_path: Path):
         with pytest.raises(FileNotFoundError):
             load_canon_at_episode("p", tmp_path, "ep001")
@@ -214,3 +252,138 @@ class TestLoadCanonAtEpisode:
         save_project_canon("p", tmp_path, {}, {}, "ep001", episode_seq=1)
         with pytest.raises(ValueError, match="not found in history"):
             load_canon_at_episode("p", tmp_path, "ep999")
+
+    def test_seeds_replay_from_snapshot_when_head_matches(self, tmp_path: Path):
+        from canon.contract import apply_canon_diff
+
+        diff1 = _diff_add_marco()
+        canon1, _ = apply_canon_diff({}, diff1)
+        save_project_canon("p", tmp_path, canon1, diff1, "ep001", episode_seq=1)
+        diff2 = {"added_facts": {"locations": {"loc_city": {"name": "City"}}}}
+        canon2, _ = apply_canon_diff(canon1, diff2)
+        save_project_canon("p", tmp_path, canon2, diff2, "ep002", episode_seq=2)
+
+        # Replay to ep002 starts from the snapshot, so ep001 is never read.
+        (tmp_path / "p" / "history" / "0001_ep001.diff.json").write_text("{not json")
+        assert load_canon_at_episode("p", tmp_path, "ep002") == canon2
+
+    def test_snapshot_not_produced_by_history_is_not_a_seed(self, tmp_path: Path):
+        """A snapshot that differs from the replay (here: extra char_lena) must be ignored."""
+        save_project_canon("p", tmp_path, _base_canon(), _diff_add_marco(), "ep001", episode_seq=1)
+        assert not (tmp_path / "p" / "CanonSnapshot.head").exists()
+
+        replayed = load_canon_at_episode("p", tmp_path, "ep001")
+        assert "char_lena" not in replayed["characters"]
+
+    def test_hand_edited_snapshot_is_not_a_seed(self, tmp_path: Path):
+        from canon.contract import apply_canon_diff
+
+        diff = _diff_add_marco()
+        canon, _ = apply_canon_diff({}, diff)
+        save_project_canon("p", tmp_path, canon, diff, "ep001", episode_seq=1)
+        assert (tmp_path / "p" / "CanonSnapshot.head").exists()
+
+        (tmp_path / "p" / "CanonSnapshot.json").write_text(json.dumps(_base_canon()))
+        assert load_canon_at_episode("p", tmp_path, "ep001") == canon
+
+    def test_canon_not_produced_by_diff_is_not_a_seed(self, tmp_path: Path):
+        """A later save whose canon diverges from its diff must not vouch for the snapshot."""
+        diff1 = {"added_facts": {"world_rules": ["r1"]}}
+        save_project_canon("p", tmp_path, {"world_rules": ["r1"]}, diff1, "ep001", episode_seq=1)
+        diff2 = {"added_facts": {"world_rules": ["r2"]}}
+        save_project_canon("p", tmp_path, {"world_rules": ["r1", "r2", "UNRECORDED"]}, diff2,
+                           "ep002", episode_seq=2)
+
+        assert not (tmp_path / "p" / "CanonSnapshot.head").exists()
+        assert load_canon_at_episode("p", tmp_path, "ep002") == {"world_rules": ["r1", "r2"]}
+
+    def test_out_of_order_save_does_not_seed_from_stale_snapshot(self, tmp_path: Path):
+        """An entry saved below the head's entry must not be skipped by later replays."""
+        from canon.contract import apply_canon_diff
+
+        diffs = {seq: {"added_facts": {"world_rules": [f"rule {seq}"]}} for seq in (1, 2, 3)}
+        canon1, _ = apply_canon_diff({}, diffs[1])
+        save_project_canon("p", tmp_path, canon1, diffs[1], "ep001", episode_seq=1)
+        canon3, _ = apply_canon_diff(canon1, diffs[3])
+        save_project_canon("p", tmp_path, canon3, diffs[3], "ep003", episode_seq=3)
+        # seq 2 arrives late; the caller's canon is left unchanged.
+        save_project_canon("p", tmp_path, canon3, diffs[2], "ep002", episode_seq=2)
+
+        assert load_canon_at_episode("p", tmp_path, "ep003") == {
+            "world_rules": ["rule 1", "rule 2", "rule 3"],
+        }
+
+    def test_checkpoint_written_every_n_entries(self, tmp_path: Path):
+        from canon.contract import apply_canon_diff
+
+        canon = {}
+        for seq in range(1, 5):
+            diff = {"added_facts": {"world_rules": [f"rule {seq}"]}}
+            canon, _ = apply_canon_diff(canon, diff)
+            save_project_canon("p", tmp_path, canon, diff, f"ep{seq:03d}",
+                               episode_seq=seq, checkpoint_every=2)
+
+        history_dir = tmp_path / "p" / "history"
+        assert sorted(p.name for p in history_dir.glob("*.snapshot.json")) == [
+            "0002_ep002.snapshot.json", "0004_ep004.snapshot.json",
+        ]
+        # Here the caller's canon equals the replay; see the diverging case below.
+        checkpoint = json.loads((history_dir / "0002_ep002.snapshot.json").read_bytes())
+        assert checkpoint == {"canon": {"world_rules": ["rule 1", "rule 2"]}, "entries": 2}
+
+    def test_seeds_replay_from_nearest_checkpoint(self, tmp_path: Path):
+        from canon.contract import apply_canon_diff
+
+        canon = {}
+        for seq in range(1, 4):
+            diff = {"added_facts": {"world_rules": [f"rule {seq}"]}}
+            canon, _ = apply_canon_diff(canon, diff)
+            save_project_canon("p", tmp_path, canon, diff, f"ep{seq:03d}",
+                               episode_seq=seq, checkpoint_every=2)
+        # Snapshot no longer matches history, so only the checkpoint can seed.
+        save_project_canon("p", tmp_path, _base_canon(), {}, "ep004", episode_seq=4,
+                           checkpoint_every=2)
+
+        history_dir = tmp_path / "p" / "history"
+        (history_dir / "0001_ep001.diff.json").write_text("{not json")
+        (history_dir / "0002_ep002.diff.json").write_text("{not json")
+        assert load_canon_at_episode("p", tmp_path, "ep003") == canon
+
+    def test_out_of_order_save_invalidates_later_checkpoint(self, tmp_path: Path):
+        """A checkpoint saved before an earlier entry arrived must not seed replay."""
+        from canon.contract import apply_canon_diff
+
+        canon = {}
+        for seq in (1, 2, 4):
+            diff = {"added_facts": {"world_rules": [f"rule {seq}"]}}
+            canon, _ = apply_canon_diff(canon, diff)
+            save_project_canon("p", tmp_path, canon, diff, f"ep{seq:03d}",
+                               episode_seq=seq, checkpoint_every=4)
+        assert (tmp_path / "p" / "history" / "0004_ep004.snapshot.json").exists()
+        save_project_canon("p", tmp_path, canon, {"added_facts": {"world_rules": ["rule 3"]}},
+                           "ep003", episode_seq=3, checkpoint_every=4)
+
+        assert load_canon_at_episode("p", tmp_path, "ep004") == {
+            "world_rules": ["rule 1", "rule 2", "rule 3", "rule 4"],
+        }
+
+    def test_checkpoint_follows_history_when_caller_canon_diverges(self, tmp_path: Path):
+        """A save whose canon is not its diff's replay must never become a checkpoint."""
+        canon = {}
+        for seq in range(1, 5):
+            diff = {"added_facts": {"world_rules": [f"rule {seq}"]}}
+            canon = {"world_rules": canon.get("world_rules", []) + [f"rule {seq}"]}
+            if seq == 3:
+                canon["world_rules"].append("UNRECORDED")
+            save_project_canon("p", tmp_path, canon, diff, f"ep{seq:03d}",
+                               episode_seq=seq, checkpoint_every=2)
+
+        history_dir = tmp_path / "p" / "history"
+        assert sorted(p.name for p in history_dir.glob("*.snapshot.json")) == [
+            "0002_ep002.snapshot.json",
+        ]
+        checkpoint = json.loads((history_dir / "0002_ep002.snapshot.json").read_bytes())
+        assert checkpoint["canon"] == {"world_rules": ["rule 1", "rule 2"]}
+        assert load_canon_at_episode("p", tmp_path, "ep004") == {
+            "world_rules": ["rule 1", "rule 2", "rule 3", "rule 4"],
+        }
@@ -10,6 +10,7 @@ from __future__ import annotations
 import types
 
 import pytest
+from pydantic import ValidationError
 
 from world_engine.adaptation.models import AudioIntent, Shot, ShotList
 from canon.decision import CanonDecision, dump_decision, evaluate_shotlist
@@ -74,6 +75,12 @@ class TestCanonDecisionContractFields:
         assert cd.decision == "deny"
         assert cd.reasons == ["FORBIDDEN_TOKEN"]
 
+    def test_shared_producer_is_immutable(self):
+        """Every decision shares one default producer, so it must reject writes."""
+        cd = evaluate_shotlist(_allow_shotlist())
+        with pytest.raises(ValidationError):
+            cd.producer.component = "Other"
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # TestGateMissingInputs
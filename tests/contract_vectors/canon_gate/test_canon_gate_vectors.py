@@ -5,7 +5,7 @@ identity between dump_decision(evaluate_shotlist(sl)) and the golden file,
 giving us a regression guard that will catch any change in serialization
 format, field ordering, or decision logic.
 """
-import json
+import functools
 import pathlib
 
 from world_engine.adaptation.models import ShotList
@@ -16,19 +16,21 @@ _FIXTURES = _HERE / "fixtures"
 _GOLDENS = _HERE / "goldens"
 
 
+@functools.lru_cache(maxsize=None)
 def _load_shotlist(name: str) -> ShotList:
-    with (_FIXTURES / name).open("r", encoding="utf-8") as f:
-        return ShotList.model_validate(json.load(f))
+    """Parse a fixture once per session; evaluate_shotlist never mutates it."""
+    return ShotList.model_validate_json((_FIXTURES / name).read_bytes())
 
 
-def _load_golden(name: str) -> str:
-    return (_GOLDENS / name).read_text(encoding="utf-8")
+def _load_golden(name: str) -> bytes:
+    # Raw bytes: a text-mode read would normalise line endings and hide drift.
+    return (_GOLDENS / name).read_bytes()
 
 
 class TestAllowVector:
     def test_byte_identity(self):
         sl = _load_shotlist("allow_shotlist.json")
-        got = dump_decision(evaluate_shotlist(sl))
+        got = dump_decision(evaluate_shotlist(sl)).encode("utf-8")
         expected = _load_golden("allow_canon_decision.json")
         assert got == expected
 
@@ -42,7 +44,7 @@ class TestAllowVector:
 class TestDenyVector:
     def test_byte_identity(self):
         sl = _load_shotlist("deny_shotlist.json")
-        got = dump_decision(evaluate_shotlist(sl))
+        got = dump_decision(evaluate_shotlist(sl)).encode("utf-8")
         expected = _load_golden("deny_canon_decision.json")
         assert got == expected
 
@@ -17,12 +17,12 @@ Determinism guarantees
 """
 from __future__ import annotations
 
+import functools
 import hashlib
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional
 
 from world_engine.adaptation.emotional_tagger import (
     derive_music_mood,
-    tag_for_dialogue,
     tag_for_reaction,
     tag_for_scene_beat,
 )
@@ -53,6 +53,7 @@ def adapt_script(
     created_at: str = _DEFAULT_CREATED_AT,
     *,
     canon_snapshot: Optional[CanonSnapshot] = None,  # noqa: F841 – plumbing only
+    validate: bool = True,
 ) -> ShotList:
     """Convert a validated Script into a ShotList with timing_lock_hash.
 
@@ -66,11 +67,17 @@ def adapt_script(
                         Accepted and validated by the caller but not used in any
                         computation — ShotList output is byte-identical with or
                         without it.
+        validate:       Check the result against the ShotList.v1.json contract
+                        (default).  Pass False only for Scripts the pipeline
+                        produced and validated itself; the output is identical
+                        either way, but nothing then guards the contract.
 
     Returns:
         A ShotList (§5.6) where every shot has duration_sec > 0 and the
         timing_lock_hash covers shot ordering and all durations.
     """
+    # Shots are built with model_construct from the already-validated Script and
+    # the static templates; validate_shotlist_model below is the one check.
     shots = _build_shots(script)
     total = round(sum(s.duration_sec for s in shots), 3)
     timing_hash = compute_timing_lock_hash(shots)
@@ -88,25 +95,27 @@ def adapt_script(
         timing_lock_hash=timing_hash,
         created_at=created_at,
     )
-    # Local import avoids a circular import via adaptation/__init__.py → adapter
-    # → contract_validate → shotlist_v1 → adaptation.models → __init__.py.
-    from world_engine.contract_validate import validate_shotlist_model  # noqa: PLC0415
-    validate_shotlist_model(shotlist)
+    if validate:
+        # Local import avoids a circular import via adaptation/__init__.py → adapter
+        # → contract_validate → shotlist_v1 → adaptation.models → __init__.py.
+        from world_engine.contract_validate import validate_shotlist_model  # noqa: PLC0415
+        validate_shotlist_model(shotlist)
     return shotlist
 
 
 # ── ID helpers ────────────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=1024)
 def _make_shotlist_id(script_id: str) -> str:
     """Deterministic shotlist ID: "sl_" + first 16 hex chars of SHA-256(script_id)."""
     digest = hashlib.sha256(script_id.encode("utf-8")).hexdigest()
     return f"sl_{digest[:16]}"
 
 
-def _make_shot_id(scene_id: str, global_index: int) -> str:
-    """Deterministic shot ID: "{scene_id}_shot_{index:03d}"."""
-    return f"{scene_id}_shot_{global_index:03d}"
+def _shot_id_prefix(scene_id: str) -> str:
+    """Scene part of a shot ID; the full ID is f"{prefix}{global_index:03d}"."""
+    return f"{scene_id}_shot_"
 
 
 # ── Shot construction ─────────────────────────────────────────────────────────
@@ -115,14 +124,38 @@ def _make_shot_id(scene_id: str, global_index: int) -> str:
 def _build_shots(script: Script) -> List[Shot]:
     shots: List[Shot] = []
     global_index = 0
+    # One CharacterInShot per character id for the whole script (see _process_scene).
+    cast: Dict[str, CharacterInShot] = {}
     for scene in script.scenes:
-        scene_shots, global_index = _process_scene(scene, global_index)
-        shots.extend(scene_shots)
+        global_index = _process_scene(scene, global_index, cast, shots)
     return shots
 
 
-def _process_scene(scene: Scene, start_index: int) -> Tuple[List[Shot], int]:
-    """Expand one scene into an ordered list of shots.
+# Templates are fixed at import time, so look each one up once.
+_TPL_ESTABLISHING = SHOT_TEMPLATES["tpl_establishing"]
+_TPL_DIALOGUE = SHOT_TEMPLATES["tpl_dialogue"]
+_TPL_REACTION = SHOT_TEMPLATES["tpl_reaction"]
+_TPL_ACTION = SHOT_TEMPLATES["tpl_action"]
+_TPL_CUTAWAY = SHOT_TEMPLATES["tpl_cutaway"]
+
+# Durations of text-less beats depend only on the template.
+_BASE_DURATIONS: Dict[str, float] = {
+    tid: estimate_shot_duration(tpl) for tid, tpl in SHOT_TEMPLATES.items()
+}
+
+
+def _cast_member(cast: Dict[str, CharacterInShot], character_id: str) -> CharacterInShot:
+    """Return the script-wide CharacterInShot for *character_id*, creating it once."""
+    member = cast.get(character_id)
+    if member is None:
+        member = cast[character_id] = CharacterInShot.model_construct(character_id=character_id)
+    return member
+
+
+def _process_scene(
+    scene: Scene, start_index: int, cast: Dict[str, CharacterInShot], shots: List[Shot],
+) -> int:
+    """Expand one scene into ordered shots, appended to *shots*; return the next index.
 
     Beat order:
         1. ESTABLISHING (always first)
@@ -131,101 +164,123 @@ def _process_scene(scene: Scene, start_index: int) -> Tuple[List[Shot], int]:
                + REACTION shot (only when scene has ≥ 2 characters)
         3. For each action: ACTION shot
         4. If no dialogue AND no actions: single CUTAWAY shot
+
+    CharacterInShot entries are read-only after construction, so they are
+    shared through *cast* (id → instance) rather than rebuilt per shot; each
+    shot still gets its own list.
     """
-    shots: List[Shot] = []
     idx = start_index
+    scene_id = scene.scene_id
+    shot_prefix = _shot_id_prefix(scene_id)
     has_content = bool(scene.dialogue or scene.actions)
     multi_char = len(scene.characters) >= 2
     music_mood = derive_music_mood(scene)
     env_notes = f"{scene.location}, {scene.time_of_day}"
+    scene_tag = tag_for_scene_beat(scene)
+    scene_cast = [_cast_member(cast, c) for c in scene.characters]
 
     # ── 1. Establishing ───────────────────────────────────────────────────
-    tpl = SHOT_TEMPLATES["tpl_establishing"]
+    tpl = _TPL_ESTABLISHING
     shots.append(
-        Shot(
-            shot_id=_make_shot_id(scene.scene_id, idx),
-            scene_id=scene.scene_id,
-            duration_sec=estimate_shot_duration(tpl),
+        Shot.model_construct(
+            shot_id=f"{shot_prefix}{idx:03d}",
+            scene_id=scene_id,
+            duration_sec=_BASE_DURATIONS[tpl.template_id],
             camera_framing=tpl.camera_framing,
             camera_movement=tpl.camera_movement,
-            characters=[CharacterInShot(character_id=c) for c in scene.characters],
+            characters=list(scene_cast),
             environment_notes=env_notes,
             action_beat=f"Establishing shot of {scene.location}.",
-            audio_intent=AudioIntent(music_mood=music_mood),
-            emotional_tag=tag_for_scene_beat(scene),
+            audio_intent=AudioIntent.model_construct(music_mood=music_mood),
+            emotional_tag=scene_tag,
             shot_template_id=tpl.template_id,
         )
     )
     idx += 1
 
     # ── 2. Dialogue beats ──────────────────────────────────────────────────
+    # Loop invariants: template fields, and everything about the reaction shot
+    # except its cast.
+    tpl_dlg = _TPL_DIALOGUE
+    dlg_framing = tpl_dlg.camera_framing
+    dlg_movement = tpl_dlg.camera_movement
+    dlg_template_id = tpl_dlg.template_id
+    if multi_char:
+        tpl_rx = _TPL_REACTION
+        rx_duration = _BASE_DURATIONS[tpl_rx.template_id]
+        rx_framing = tpl_rx.camera_framing
+        rx_movement = tpl_rx.camera_movement
+        rx_template_id = tpl_rx.template_id
+        rx_tag = tag_for_reaction(scene)
+        # Reaction cast per speaker: everyone in the scene but them.
+        rx_casts = {
+            speaker: [c for c in scene_cast if c.character_id != speaker]
+            for speaker in {line.speaker_id for line in scene.dialogue}
+        }
     for line in scene.dialogue:
-        tpl_dlg = SHOT_TEMPLATES["tpl_dialogue"]
+        speaker_id = line.speaker_id
         shots.append(
-            Shot(
-                shot_id=_make_shot_id(scene.scene_id, idx),
-                scene_id=scene.scene_id,
+            Shot.model_construct(
+                shot_id=f"{shot_prefix}{idx:03d}",
+                scene_id=scene_id,
                 duration_sec=estimate_shot_duration(tpl_dlg, text=line.text),
-                camera_framing=tpl_dlg.camera_framing,
-                camera_movement=tpl_dlg.camera_movement,
-                characters=[CharacterInShot(character_id=line.speaker_id)],
+                camera_framing=dlg_framing,
+                camera_movement=dlg_movement,
+                characters=[_cast_member(cast, speaker_id)],
                 environment_notes=env_notes,
-                action_beat=f"{line.speaker_id} speaks.",
-                audio_intent=AudioIntent(
+                action_beat=f"{speaker_id} speaks.",
+                audio_intent=AudioIntent.model_construct(
                     vo_text=line.text,
-                    vo_speaker_id=line.speaker_id,
+                    vo_speaker_id=speaker_id,
                     music_mood=music_mood,
                 ),
-                emotional_tag=tag_for_dialogue(line, scene),
-                shot_template_id=tpl_dlg.template_id,
+                # tag_for_dialogue's rule, reusing the scene fallback computed above.
+                emotional_tag=line.emotion or scene_tag,
+                shot_template_id=dlg_template_id,
             )
         )
         idx += 1
 
         if multi_char:
-            tpl_rx = SHOT_TEMPLATES["tpl_reaction"]
-            react_chars = [
-                CharacterInShot(character_id=c)
-                for c in scene.characters
-                if c != line.speaker_id
-            ]
+            react_chars = list(rx_casts[speaker_id])
             shots.append(
-                Shot(
-                    shot_id=_make_shot_id(scene.scene_id, idx),
-                    scene_id=scene.scene_id,
-                    duration_sec=estimate_shot_duration(tpl_rx),
-                    camera_framing=tpl_rx.camera_framing,
-                    camera_movement=tpl_rx.camera_movement,
+                Shot.model_construct(
+                    shot_id=f"{shot_prefix}{idx:03d}",
+                    scene_id=scene_id,
+                    duration_sec=rx_duration,
+                    camera_framing=rx_framing,
+                    camera_movement=rx_movement,
                     characters=react_chars,
                     environment_notes=env_notes,
                     action_beat="Reaction shot.",
-                    audio_intent=AudioIntent(music_mood=music_mood),
-                    emotional_tag=tag_for_reaction(scene),
-                    shot_template_id=tpl_rx.template_id,
+                    audio_intent=AudioIntent.model_construct(music_mood=music_mood),
+                    emotional_tag=rx_tag,
+                    shot_template_id=rx_template_id,
                 )
             )
             idx += 1
 
     # ── 3. Action beats ────────────────────────────────────────────────────
+    tpl_act = _TPL_ACTION
+    act_duration = _BASE_DURATIONS[tpl_act.template_id]
     for action in scene.actions:
-        tpl_act = SHOT_TEMPLATES["tpl_action"]
         action_chars = (
-            [CharacterInShot(character_id=c) for c in action.characters]
+            [_cast_member(cast, c) for c in action.characters]
             if action.characters
-            else [CharacterInShot(character_id=c) for c in scene.characters]
+            else list(scene_cast)
         )
         shots.append(
-            Shot(
-                shot_id=_make_shot_id(scene.scene_id, idx),
-                scene_id=scene.scene_id,
-                duration_sec=estimate_shot_duration(tpl_act),
+            Shot.model_construct(
+                shot_id=f"{shot_prefix}{idx:03d}",
+                scene_id=scene_id,
+                duration_sec=act_duration,
                 camera_framing=tpl_act.camera_framing,
                 camera_movement=tpl_act.camera_movement,
                 characters=action_chars,
                 environment_notes=env_notes,
                 action_beat=action.description,
-                audio_intent=AudioIntent(music_mood=music_mood),
-                emotional_tag=tag_for_scene_beat(scene),
+                audio_intent=AudioIntent.model_construct(music_mood=music_mood),
+                emotional_tag=scene_tag,
                 shot_template_id=tpl_act.template_id,
             )
         )
@@ -233,22 +288,22 @@ def _process_scene(scene: Scene, start_index: int) -> Tuple[List[Shot], int]:
 
     # ── 4. Cutaway — only when no other content ────────────────────────────
     if not has_content:
-        tpl_cut = SHOT_TEMPLATES["tpl_cutaway"]
+        tpl_cut = _TPL_CUTAWAY
         shots.append(
-            Shot(
-                shot_id=_make_shot_id(scene.scene_id, idx),
-                scene_id=scene.scene_id,
-                duration_sec=estimate_shot_duration(tpl_cut),
+            Shot.model_construct(
+                shot_id=f"{shot_prefix}{idx:03d}",
+                scene_id=scene_id,
+                duration_sec=_BASE_DURATIONS[tpl_cut.template_id],
                 camera_framing=tpl_cut.camera_framing,
                 camera_movement=tpl_cut.camera_movement,
-                characters=[CharacterInShot(character_id=c) for c in scene.characters],
+                characters=list(scene_cast),
                 environment_notes=env_notes,
                 action_beat="Cutaway detail.",
-                audio_intent=AudioIntent(music_mood=music_mood),
-                emotional_tag=tag_for_scene_beat(scene),
+                audio_intent=AudioIntent.model_construct(music_mood=music_mood),
+                emotional_tag=scene_tag,
                 shot_template_id=tpl_cut.template_id,
             )
         )
         idx += 1
 
-    return shots, idx
+    return idx
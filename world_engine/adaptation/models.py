@@ -66,9 +66,12 @@ class Script(BaseModel):
 
 
 class CharacterInShot(BaseModel):
-    """A character's appearance within a single shot."""
+    """A character's appearance within a single shot.
 
-    model_config = ConfigDict(extra="ignore")
+    Frozen: the adapter shares one instance per character across shots.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     character_id: str
     expression: Optional[str] = None
@@ -78,7 +81,7 @@ class CharacterInShot(BaseModel):
 class AudioIntent(BaseModel):
     """Audio intent for a shot: VO reference, SFX tags, and music mood."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     vo_text: Optional[str] = None
     vo_speaker_id: Optional[str] = None
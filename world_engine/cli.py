@@ -13,12 +13,14 @@ def main() -> None:
         description="World Engine — narrative-to-video platform",
     )
     sub = parser.add_subparsers(dest="command", metavar="COMMAND")
-    sub.add_parser("verify", help="Run contract vector verification")
+    verify_parser = sub.add_parser("verify", help="Run contract vector verification")
+    verify_parser.set_defaults(func=_run_verify)
     validate_parser = sub.add_parser("validate-script", help="Validate a Script JSON file")
     validate_parser.add_argument(
         "--script", required=True, metavar="script.json",
         help="Path to a Script JSON file",
     )
+    validate_parser.set_defaults(func=_run_validate_script)
     validate_shotlist_parser = sub.add_parser(
         "validate-shotlist",
         help="Validate an existing ShotList JSON file against the canonical contract",
@@ -27,6 +29,7 @@ def main() -> None:
         "--shotlist", required=True, metavar="shotlist.json",
         help="Path to a ShotList JSON file",
     )
+    validate_shotlist_parser.set_defaults(func=_run_validate_shotlist)
     produce_parser = sub.add_parser(
         "produce-shotlist",
         help="Adapt a Script JSON → validated canonical ShotList JSON",
@@ -39,6 +42,7 @@ def main() -> None:
         "--output", required=True, metavar="shotlist.json",
         help="Destination path for the canonical ShotList JSON",
     )
+    produce_parser.set_defaults(func=_run_produce_shotlist)
     draft_parser = sub.add_parser(
         "validate-story-draft",
         help="Validate a Script JSON draft against a CanonSnapshot before compilation",
@@ -55,51 +59,68 @@ def main() -> None:
         "--out", required=False, metavar="CanonViolationReport.json",
         help="Optional path to write CanonViolationReport.json (only written on failure)",
     )
+    draft_parser.set_defaults(func=_run_validate_story_draft)
     args = parser.parse_args()
 
-    if args.command == "verify":
-        from world_engine.verify import run_verify
-        if run_verify():
-            print("OK: world-engine verified")
-            sys.exit(0)
-        else:
-            print("ERROR: world-engine verification failed")
-            sys.exit(1)
-    elif args.command == "validate-script":
-        import jsonschema
-        from world_engine.schema_loader import load_schema
-        script_path = Path(args.script)
-        if not script_path.exists():
-            print("ERROR: invalid Script")
-            sys.exit(1)
-        try:
-            data = json.loads(script_path.read_text(encoding="utf-8"))
-            jsonschema.validate(data, load_schema("Script.v1.json"))
-        except (json.JSONDecodeError, jsonschema.ValidationError, Exception):
-            print("ERROR: invalid Script")
-            sys.exit(1)
-        sys.exit(0)
-    elif args.command == "validate-shotlist":
-        import jsonschema
-        try:
-            validate_shotlist_file(Path(args.shotlist))
-        except jsonschema.ValidationError as exc:
-            print(f"ERROR: invalid ShotList — {exc.message}")
-            sys.exit(1)
-        except Exception as exc:
-            print(f"ERROR: {exc}")
-            sys.exit(1)
-        print("OK: ShotList is valid")
+    # Each handler imports only what its command needs.
+    func = getattr(args, "func", None)
+    if func is None:
+        parser.print_help()
+        sys.exit(1)
+    func(args)
+
+
+def _run_verify(args) -> None:
+    """Handler for the verify subcommand."""
+    from world_engine.verify import run_verify  # noqa: PLC0415
+
+    if run_verify():
+        print("OK: world-engine verified")
         sys.exit(0)
-    elif args.command == "produce-shotlist":
-        produce_shotlist(Path(args.script), Path(args.output))
-    elif args.command == "validate-story-draft":
-        _run_validate_story_draft(args)
     else:
-        parser.print_help()
+        print("ERROR: world-engine verification failed")
         sys.exit(1)
 
 
+def _run_validate_script(args) -> None:
+    """Handler for the validate-script subcommand."""
+    import jsonschema  # noqa: PLC0415
+    from world_engine.schema_loader import validate_against  # noqa: PLC0415
+
+    script_path = Path(args.script)
+    if not script_path.exists():
+        print("ERROR: invalid Script")
+        sys.exit(1)
+    try:
+        data = json.loads(script_path.read_bytes())
+        validate_against(data, "Script.v1.json")
+    except (json.JSONDecodeError, jsonschema.ValidationError, Exception):
+        print("ERROR: invalid Script")
+        sys.exit(1)
+    sys.exit(0)
+
+
+def _run_produce_shotlist(args) -> None:
+    """Handler for the produce-shotlist subcommand."""
+    produce_shotlist(Path(args.script), Path(args.output))
+
+
+def _run_validate_shotlist(args) -> None:
+    """Handler for the validate-shotlist subcommand."""
+    import jsonschema  # noqa: PLC0415
+
+    try:
+        validate_shotlist_file(Path(args.shotlist))
+    except jsonschema.ValidationError as exc:
+        print(f"ERROR: invalid ShotList — {exc.message}")
+        sys.exit(1)
+    except Exception as exc:
+        print(f"ERROR: {exc}")
+        sys.exit(1)
+    print("OK: ShotList is valid")
+    sys.exit(0)
+
+
 def validate_shotlist_file(shotlist_path: Path) -> None:
     """Load a ShotList JSON file and validate it against the canonical contract.
 
@@ -108,7 +129,7 @@ def validate_shotlist_file(shotlist_path: Path) -> None:
     """
     from world_engine.contract_validate import validate_shotlist
 
-    data = json.loads(shotlist_path.read_text(encoding="utf-8"))
+    data = json.loads(shotlist_path.read_bytes())
     validate_shotlist(data)
 
 
@@ -131,12 +152,14 @@ def _contract_to_internal(data: dict) -> dict:
         dialogue: list = []
         actions: list = []
         characters: list = []
+        seen_speakers: set = set()   # membership only; characters keeps first-seen order
         for item in scene.get("actions", []):
             text = item.get("text") or item.get("line", "")
             if item.get("type") == "dialogue":
                 speaker = item.get("character") or item.get("speaker", "")
                 dialogue.append({"speaker_id": speaker, "text": text})
-                if speaker and speaker not in characters:
+                if speaker and speaker not in seen_speakers:
+                    seen_speakers.add(speaker)
                     characters.append(speaker)
             else:
                 actions.append({
@@ -166,7 +189,7 @@ def _run_validate_story_draft(args) -> None:
     import jsonschema  # noqa: PLC0415
 
     from canon.canon_io import load_canon                          # noqa: PLC0415
-    from world_engine.schema_loader import load_schema             # noqa: PLC0415
+    from world_engine.schema_loader import validate_against        # noqa: PLC0415
     from world_engine.story_draft_validator import validate_story_draft  # noqa: PLC0415
 
     draft_path = Path(args.draft)
@@ -184,7 +207,7 @@ def _run_validate_story_draft(args) -> None:
         sys.exit(1)
 
     try:
-        jsonschema.validate(draft, load_schema("Script.v1.json"))
+        validate_against(draft, "Script.v1.json")
     except jsonschema.ValidationError as exc:
         print(f"ERROR: draft does not conform to Script.v1.json — {exc.message}")
         sys.exit(1)
@@ -220,7 +243,7 @@ def _run_validate_story_draft(args) -> None:
 
     # validate report against its own schema before writing
     try:
-        jsonschema.validate(report, load_schema("CanonViolationReport.v1.json"))
+        validate_against(report, "CanonViolationReport.v1.json")
     except jsonschema.ValidationError:
         pass  # schema mismatch is a bug, not user error — still emit the report
 
@@ -244,28 +267,33 @@ def produce_shotlist(script_path: Path, output_path: Path) -> None:
 
     The output file is never written when validation fails.
     """
-    import jsonschema  # noqa: PLC0415
     from world_engine.adaptation.adapter import adapt_script
     from world_engine.adaptation.models import Script
     from world_engine.contract_validate import validate_shotlist
-    from world_engine.schema_loader import load_schema
-    from world_engine.schemas.shotlist_v1 import canonical_json_bytes
+    from world_engine.schema_loader import validate_against
 
-    raw_data = json.loads(script_path.read_text(encoding="utf-8"))
+    # One parse of the raw bytes; the resulting dict feeds both the contract
+    # check and the mapping below, so the file is never decoded twice.
+    raw_data = json.loads(script_path.read_bytes())
 
     # Bug 1 fix: validate input against canonical Script.v1.json BEFORE Pydantic.
     # Raises jsonschema.ValidationError on any contract violation.
-    jsonschema.validate(raw_data, load_schema("Script.v1.json"))
+    validate_against(raw_data, "Script.v1.json")
 
     # Bug 2 fix: map canonical contract format → internal Pydantic format.
     script = Script.model_validate(_contract_to_internal(raw_data))
-    sl = adapt_script(script)
+    # The canonical projection is validated below before writing, so skip the
+    # adapter's identical check.
+    sl = adapt_script(script, validate=False)
 
     # Project to canonical v1.0.0 format:
     #   • remove internal-only fields not present in the canonical schema
     #     (producer, schema_id) so additionalProperties:false is satisfied
     #   • pin schema_version to the canonical constant "1.0.0"
-    raw = json.loads(canonical_json_bytes(sl).decode("utf-8"))
+    # model_dump(mode="json") yields the same JSON-typed dict that
+    # json.loads(canonical_json_bytes(sl)) would, without the serialize and
+    # re-parse passes in between.
+    raw = sl.model_dump(mode="json")
     canonical = {k: v for k, v in raw.items() if k != "producer"}
     canonical["schema_version"] = "1.0.0"
 
@@ -1,8 +1,6 @@
 import json
 
-import jsonschema
-
-from .schema_loader import load_schema
+from .schema_loader import validate_against
 from .schemas.shotlist_v1 import canonical_json_bytes
 
 
@@ -11,8 +9,7 @@ def validate_shotlist(data: dict) -> None:
 
     Raises jsonschema.ValidationError if non-conformant.
     """
-    schema = load_schema("ShotList.v1.json")
-    jsonschema.validate(data, schema)
+    validate_against(data, "ShotList.v1.json")
 
 
 def validate_shotlist_model(sl) -> None:
@@ -1,9 +1,35 @@
 from pathlib import Path
+import functools
 import json
 
+import jsonschema
+
+
 def load_schema(name: str):
     root = Path(__file__).resolve().parents[1]
     schema_path = root / "third_party" / "contracts" / "schemas" / name
     if not schema_path.exists():
         raise FileNotFoundError(f"Missing canonical schema: {schema_path}")
     return json.loads(schema_path.read_text())
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator(name: str):
+    """Checked validator for schema *name*, built once per process.
+
+    Same draft selection as jsonschema.validate (the schema's $schema).
+    """
+    schema = load_schema(name)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_against(data, name: str) -> None:
+    """jsonschema.validate(data, load_schema(name)) with the cached validator.
+
+    Raises the same best-matching jsonschema.ValidationError.
+    """
+    error = jsonschema.exceptions.best_match(get_validator(name).iter_errors(data))
+    if error is not None:
+        raise error
@@ -33,7 +33,7 @@ import re
 from typing import Any
 
 from canon.contract import Canon
-from canon.gate import check_hard_contradictions
+from canon.gate import IMMUTABLE_FIELDS, check_hard_contradictions
 
 
 # ---------------------------------------------------------------------------
@@ -62,7 +62,7 @@ def _extract_characters(script: dict) -> dict[str, dict[str, Any]]:
         if not char_id or not isinstance(char_id, str):
             continue
         facts: dict[str, Any] = {}
-        for fact_key in ("name", "age", "alive", "location"):
+        for fact_key in IMMUTABLE_FIELDS:
             if fact_key in entry:
                 facts[fact_key] = entry[fact_key]
         chars[char_id] = facts
@@ -143,7 +143,7 @@ def validate_story_draft(script: dict, canon: Canon) -> list[dict]:
         char_facts["alive"] = True
 
         # Merge any explicit facts from the script's characters list
-        for fact_key in ("name", "age", "alive", "location"):
+        for fact_key in IMMUTABLE_FIELDS:
             if fact_key in explicit_facts:
                 char_facts[fact_key] = explicit_facts[fact_key]
 
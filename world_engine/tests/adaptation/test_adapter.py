@@ -335,3 +335,35 @@ class TestEmotionalTags:
         ])
         sl = adapt_script(script, created_at=FIXED_AT)
         assert sl.shots[0].emotional_tag == "dread"
+
+
+# ── Contract validation switch ─────────────────────────────────────────────────
+
+
+class TestValidateSwitch:
+    def _script(self) -> Script:
+        return _make_script(scenes=[
+            Scene(
+                scene_id="s001",
+                location="Tavern",
+                time_of_day="NIGHT",
+                characters=["char_a", "char_b"],
+                dialogue=[DialogueLine(speaker_id="char_a", text="Hello there.")],
+            )
+        ])
+
+    def test_validate_false_skips_contract_check(self, monkeypatch):
+        import world_engine.contract_validate as cv
+
+        def _fail(_sl):
+            raise AssertionError("validate_shotlist_model must not run")
+
+        monkeypatch.setattr(cv, "validate_shotlist_model", _fail)
+        adapt_script(self._script(), created_at=FIXED_AT, validate=False)
+        with pytest.raises(AssertionError):
+            adapt_script(self._script(), created_at=FIXED_AT)
+
+    def test_validate_false_output_identical(self):
+        validated = adapt_script(self._script(), created_at=FIXED_AT)
+        unvalidated = adapt_script(self._script(), created_at=FIXED_AT, validate=False)
+        assert unvalidated.model_dump() == validated.model_dump()
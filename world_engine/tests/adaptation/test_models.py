@@ -150,6 +150,18 @@ class TestShotListValidation:
 # ── Forward-compatibility (unknown fields ignored) ────────────────────────────
 
 
+class TestFrozenShotParts:
+    def test_character_in_shot_is_frozen(self):
+        c = CharacterInShot(character_id="char_a")
+        with pytest.raises(ValidationError):
+            c.character_id = "char_b"
+
+    def test_audio_intent_is_frozen(self):
+        a = AudioIntent(music_mood="tense")
+        with pytest.raises(ValidationError):
+            a.music_mood = "calm"
+
+
 class TestForwardCompatibility:
     def test_unknown_field_in_script_ignored(self):
         data = {
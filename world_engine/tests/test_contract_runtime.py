@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from world_engine.cli import produce_shotlist, validate_shotlist_file
+from world_engine.cli import _contract_to_internal, produce_shotlist, validate_shotlist_file
 from world_engine.contract_validate import validate_shotlist
 
 _CONTRACTS_DIR = Path(__file__).resolve().parents[2] / "third_party" / "contracts"
@@ -78,6 +78,29 @@ def test_produce_shotlist_validates_against_canonical_schema(tmp_path: Path) ->
     validate_shotlist(data)
 
 
+def test_contract_to_internal_dedups_speakers_in_first_seen_order() -> None:
+    """Each scene lists every dialogue speaker once, in order of first line."""
+    script = dict(_MINIMAL_SCRIPT)
+    script["scenes"] = [
+        {
+            "scene_id": "rts_s001",
+            "location": "Test Location",
+            "time_of_day": "DAY",
+            "actions": [
+                {"type": "dialogue", "character": "char_b", "text": "One."},
+                {"type": "dialogue", "character": "char_a", "text": "Two."},
+                {"type": "action", "text": "A pause."},
+                {"type": "dialogue", "speaker": "char_b", "text": "Three."},
+                {"type": "dialogue", "character": "char_c", "text": "Four."},
+            ],
+        }
+    ]
+
+    internal = _contract_to_internal(script)
+
+    assert internal["scenes"][0]["characters"] == ["char_b", "char_a", "char_c"]
+
+
 def test_validate_shotlist_file_accepts_valid(tmp_path: Path) -> None:
     """validate-shotlist accepts a ShotList that conforms to ShotList.v1.json."""
     script_file = tmp_path / "script.json"
@@ -92,7 +92,8 @@ def _run_canongate_vectors() -> Dict[str, bytes]:
 
     dump_decision() returns str; encode to UTF-8 for uniform bytes comparison.
     Golden files were written without trailing newline (confirmed by existing
-    passing tests: test_canon_gate_vectors.py uses read_text() == dump_decision()).
+    passing tests: test_canon_gate_vectors.py compares read_bytes() with the
+    encoded dump_decision()).
     """
     results: Dict[str, bytes] = {}
     for fixture_file, key in [